@@ -412,6 +412,10 @@ class Hyperband(ParallelScheduler):
         self.max_budget = max_budget
         self.eta = eta
 
+        # Number of workers for which no more _Hyperband instances can be added.
+        # The number of workers may change between calls, so this is not a plain flag
+        self._saturated_num_workers = None  # type: typing.Optional[int]
+
     def _get_intensifier_ranking(self, intensifier: AbstractRacer) -> typing.Tuple[int, int]:
         """Given a intensifier, returns how advance it is. This metric will be used to determine
         what priority to assign to the intensifier.
@@ -437,11 +441,7 @@ class Hyperband(ParallelScheduler):
 
         # For hyperband, we use the internal successive halving as a criteria
         # to see how advanced this intensifier is
-        stage = 0
-        if hasattr(intensifier.sh_intensifier, "stage"):
-            # Newly created SuccessiveHalving objects have no stage
-            stage = intensifier.sh_intensifier.stage
-        return stage, len(intensifier.sh_intensifier.run_tracker)
+        return intensifier.sh_intensifier.stage, len(intensifier.sh_intensifier.run_tracker)
 
     def _add_new_instance(self, num_workers: int) -> bool:
         """Decides if it is possible to add a new intensifier instance, and adds it. If a new
@@ -456,27 +456,35 @@ class Hyperband(ParallelScheduler):
         -------
             Whether or not a new instance was added.
         """
+        if num_workers == self._saturated_num_workers:
+            return False
+
         if len(self.intensifier_instances) >= num_workers:
+            self._saturated_num_workers = num_workers
             return False
 
-        self.intensifier_instances[len(self.intensifier_instances)] = _Hyperband(
-            stats=self.stats,
-            traj_logger=self.traj_logger,
-            rng=self.rs,
-            instances=self._instances,
-            instance_specifics=self._instance_specifics,
-            cutoff=self.cutoff,
-            deterministic=self.deterministic,
-            initial_budget=self.initial_budget,
-            max_budget=self.max_budget,
-            eta=self.eta,
-            run_obj_time=self.run_obj_time,
-            n_seeds=self.n_seeds,
-            instance_order=self.instance_order,
-            adaptive_capping_slackfactor=self.adaptive_capping_slackfactor,
-            min_chall=self.min_chall,
-            incumbent_selection=self.incumbent_selection,
-            identifier=len(self.intensifier_instances),
+        self.intensifier_instances.append(
+            _Hyperband(
+                stats=self.stats,
+                traj_logger=self.traj_logger,
+                rng=self.rs,
+                instances=self._instances,
+                instance_specifics=self._instance_specifics,
+                cutoff=self.cutoff,
+                deterministic=self.deterministic,
+                initial_budget=self.initial_budget,
+                max_budget=self.max_budget,
+                eta=self.eta,
+                run_obj_time=self.run_obj_time,
+                n_seeds=self.n_seeds,
+                instance_order=self.instance_order,
+                adaptive_capping_slackfactor=self.adaptive_capping_slackfactor,
+                min_chall=self.min_chall,
+                incumbent_selection=self.incumbent_selection,
+                identifier=len(self.intensifier_instances),
+            )
         )
+        if len(self.intensifier_instances) >= num_workers:
+            self._saturated_num_workers = num_workers
 
         return True
@@ -107,7 +107,7 @@ class ParallelScheduler(AbstractRacer):
         )
 
         # We have a pool of instances that yield configurations ot run
-        self.intensifier_instances = {}  # type: typing.Dict[int, AbstractRacer]
+        self.intensifier_instances = []  # type: typing.List[AbstractRacer]
         self.print_worker_warning = True
 
     def get_next_run(
@@ -184,9 +184,11 @@ class ParallelScheduler(AbstractRacer):
             return intent, run_info
 
         # If gotten to this point, we might look into adding a new
-        # intensifier
+        # intensifier. Instances are only created here, when every existing
+        # instance has to wait, and are immediately asked for their first run,
+        # so no intensifier is built for a worker that would stay idle
         if self._add_new_instance(num_workers):
-            return self.intensifier_instances[len(self.intensifier_instances) - 1].get_next_run(
+            return self.intensifier_instances[-1].get_next_run(
                 challengers=challengers,
                 incumbent=incumbent,
                 chooser=chooser,
@@ -298,15 +300,15 @@ class ParallelScheduler(AbstractRacer):
         """
         raise NotImplementedError()
 
-    def _sort_instances_by_stage(self, instances: typing.Dict[int, AbstractRacer]) -> typing.List[int]:
+    def _sort_instances_by_stage(self, instances: typing.List[AbstractRacer]) -> typing.List[int]:
         """This procedure dictates what SH to prioritize in launching jobs. It prioritizes resource
         allocation to SH instances that have higher stages. In case of tie, we prioritize the SH
         instance with more launched configs.
 
         Parameters
         ----------
-        instances: typing.Dict[int, AbstractRacer]
-            Dict with the instances to prioritize
+        instances: typing.List[AbstractRacer]
+            List with the instances to prioritize, indexed by their identifier
 
         Returns
         -------
@@ -325,7 +327,7 @@ class ParallelScheduler(AbstractRacer):
         # to be finished earlier). Also, in case of tie (runs at same stage) we need a
         # tie breaker, which can be the number of configs already launched
         preference = []
-        for i, sh in instances.items():
+        for i, sh in enumerate(instances):
             ranking, tie_breaker = self._get_intensifier_ranking(sh)
             preference.append(
                 (i, ranking, tie_breaker),
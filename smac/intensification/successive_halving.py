@@ -1,7 +1,8 @@
-from typing import Dict, List, Mapping, Optional, Set, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import logging
 import warnings
+from types import MappingProxyType
 
 import numpy as np
 
@@ -20,6 +21,60 @@ __copyright__ = "Copyright 2019, ML4AAD"
 __license__ = "3-clause BSD"
 
 
+def _build_inst_seed_pairs(
+    instances: List[str],
+    n_seeds: int,
+    deterministic: bool,
+    instance_order: Optional[str],
+    rs: np.random.RandomState,
+    logger: logging.Logger,
+) -> List[Tuple[str, int]]:
+    """Creates the instance-seed pairs to be used across successive halving runs.
+
+    Parameters
+    ----------
+    instances : List[str]
+        list of all instance ids
+    n_seeds : int
+        Number of seeds to use, if TA is not deterministic
+    deterministic : bool
+        whether the TA is deterministic or not
+    instance_order : Optional[str]
+        how to order instances, the pairs are shuffled here for shuffle_once
+    rs : np.random.RandomState
+        random state used to draw the seeds and to shuffle the pairs
+    logger : logging.Logger
+        logger used to warn about a single seed for a non-deterministic TA
+
+    Returns
+    -------
+    inst_seed_pairs : List[Tuple[str, int]]
+        instance-seed pairs in the order in which they will be evaluated
+    """
+    # set seed(s) for all SH runs
+    # - currently user gives the number of seeds to consider
+    if deterministic:
+        seeds = [0]
+    else:
+        seeds = [int(s) for s in rs.randint(low=0, high=MAXINT, size=n_seeds)]
+        if n_seeds == 1:
+            logger.warning(
+                "The target algorithm is specified to be non deterministic, "
+                "but number of seeds to evaluate are set to 1. "
+                "Consider setting `n_seeds` > 1."
+            )
+
+    # storing instances & seeds as tuples
+    inst_seed_pairs = [(i, s) for s in seeds for i in instances]
+
+    # determine instance-seed pair order
+    if instance_order == "shuffle_once":
+        # randomize once
+        rs.shuffle(inst_seed_pairs)  # type: ignore
+
+    return inst_seed_pairs
+
+
 class _SuccessiveHalving(AbstractRacer):
     """Races multiple challengers against an incumbent using Successive Halving method.
 
@@ -114,6 +169,10 @@ class _SuccessiveHalving(AbstractRacer):
         logger messages properly
     """
 
+    # Stage of the current iteration. Defined at class level so that newly created
+    # objects, which are only initialized on their first ``_update_stage``, can be ranked
+    stage = 0
+
     def __init__(
         self,
         stats: Stats,
@@ -172,26 +231,14 @@ class _SuccessiveHalving(AbstractRacer):
         # it is already taken care by Hyperband
 
         if not inst_seed_pairs:
-            # set seed(s) for all SH runs
-            # - currently user gives the number of seeds to consider
-            if self.deterministic:
-                seeds = [0]
-            else:
-                seeds = [int(s) for s in self.rs.randint(low=0, high=MAXINT, size=self.n_seeds)]
-                if self.n_seeds == 1:
-                    self.logger.warning(
-                        "The target algorithm is specified to be non deterministic, "
-                        "but number of seeds to evaluate are set to 1. "
-                        "Consider setting `n_seeds` > 1."
-                    )
-
-            # storing instances & seeds as tuples
-            self.inst_seed_pairs = [(i, s) for s in seeds for i in self.instances]
-
-            # determine instance-seed pair order
-            if self.instance_order == "shuffle_once":
-                # randomize once
-                self.rs.shuffle(self.inst_seed_pairs)  # type: ignore
+            self.inst_seed_pairs = _build_inst_seed_pairs(
+                instances=self.instances,
+                n_seeds=self.n_seeds,
+                deterministic=self.deterministic,
+                instance_order=self.instance_order,
+                rs=self.rs,
+                logger=self.logger,
+            )
         else:
             self.inst_seed_pairs = inst_seed_pairs
 
@@ -250,6 +297,12 @@ class _SuccessiveHalving(AbstractRacer):
         # the ones launched by the current succesive halver using self.run_tracker
         self.run_tracker = {}  # type: Dict[Tuple[Configuration, str, int, float], bool]
 
+        # The parallel scheduler ranks this instance by (stage, len(run_tracker)) on every
+        # scheduling decision. _version is bumped whenever stage or run_tracker change,
+        # so that the scheduler can re-use the ranking stored in _ranking_cache.
+        self._version = 0
+        self._ranking_cache = None  # type: Optional[Tuple[int, Tuple[int, int]]]
+
     def _init_sh_params(
         self,
         initial_budget: Optional[float],
@@ -381,6 +434,7 @@ class _SuccessiveHalving(AbstractRacer):
         """
         # Mark the fact that we processed this configuration
         self.run_tracker[(run_info.config, run_info.instance, run_info.seed, run_info.budget)] = True
+        self._version += 1
 
         # If The incumbent is None and it is the first run, we use the challenger
         if not incumbent and self.first_run:
@@ -523,7 +577,7 @@ class _SuccessiveHalving(AbstractRacer):
                 "transition until all configs for the current stage are completed."
             )
         # if this is the first run, then initialize tracking variables
-        if not hasattr(self, "stage"):
+        if not hasattr(self, "sh_iters"):
             self._update_stage(run_history=run_history)
 
         # In the case of multiprocessing, we have runs in Running stage, which have not
@@ -673,6 +727,7 @@ class _SuccessiveHalving(AbstractRacer):
         budget = 0.0 if self.instance_as_budget else curr_budget
 
         self.run_tracker[(challenger, instance, seed, budget)] = False
+        self._version += 1
 
         # self.curr_inst_idx Tell us our current instance to be run. The upcoming return
         # will launch a challenger on a given instance/seed/pair. The next time this function
@@ -700,7 +755,7 @@ class _SuccessiveHalving(AbstractRacer):
          run_history : smac.runhistory.runhistory.RunHistory
             stores all runs we ran so far
         """
-        if not hasattr(self, "stage"):
+        if not hasattr(self, "sh_iters"):
             # initialize all relevant variables for first run
             # (this initialization is not a part of init because hyperband uses the same init method and has a )
             # to track iteration and stage
@@ -778,6 +833,9 @@ class _SuccessiveHalving(AbstractRacer):
                 if self.instance_order == "shuffle":
                     self.rs.shuffle(self.inst_seed_pairs)  # type: ignore
 
+        # stage and/or run_tracker changed, so invalidate the cached ranking
+        self._version += 1
+
         # to track configurations for the next stage
         self.success_challengers = set()  # successful configs
         self.do_not_advance_challengers = set()  # successful, but should not be advanced to the next budget/stage
@@ -1237,8 +1295,6 @@ class SuccessiveHalving(ParallelScheduler):
             min_chall=min_chall,
         )
 
-        self.logger = logging.getLogger(self.__module__ + "." + self.__class__.__name__)
-
         # Successive Halving Hyperparameters
         self.n_seeds = n_seeds
         self.instance_order = instance_order
@@ -1251,6 +1307,56 @@ class SuccessiveHalving(ParallelScheduler):
         self.eta = eta
         self.num_initial_challengers = num_initial_challengers
 
+        # Instance-seed pairs are computed once and shared by all _SuccessiveHalving instances
+        if not self.inst_seed_pairs:
+            self.inst_seed_pairs = _build_inst_seed_pairs(
+                instances=self.instances,
+                n_seeds=self.n_seeds if self.n_seeds else 1,
+                deterministic=self.deterministic,
+                instance_order=self.instance_order,
+                rs=self.rs,
+                logger=self.logger,
+            )
+
+        # Arguments shared by every _SuccessiveHalving instance created by this scheduler.
+        # They are exposed read-only, so that accidental modifications raise a TypeError
+        self._sh_kwargs = MappingProxyType(
+            dict(
+                stats=self.stats,
+                traj_logger=self.traj_logger,
+                rng=self.rs,
+                instances=self._instances,
+                instance_specifics=self._instance_specifics,
+                cutoff=self.cutoff,
+                deterministic=self.deterministic,
+                initial_budget=self.initial_budget,
+                max_budget=self.max_budget,
+                eta=self.eta,
+                num_initial_challengers=self.num_initial_challengers,
+                run_obj_time=self.run_obj_time,
+                n_seeds=self.n_seeds,
+                instance_order=self.instance_order,
+                adaptive_capping_slackfactor=self.adaptive_capping_slackfactor,
+                inst_seed_pairs=self.inst_seed_pairs,
+                min_chall=self.min_chall,
+                incumbent_selection=self.incumbent_selection,
+            )
+        )  # type: Mapping[str, Any]
+
+        # Number of workers for which no more _SuccessiveHalving instances can be added.
+        # The number of workers may change between calls, so this is not a plain flag
+        self._saturated_num_workers = None  # type: Optional[int]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # mappingproxy objects cannot be pickled, so the shared arguments are stored as a dict
+        d = dict(self.__dict__)
+        d["_sh_kwargs"] = dict(self._sh_kwargs)
+        return d
+
+    def __setstate__(self, d: Dict[str, Any]) -> None:
+        self.__dict__.update(d)
+        self._sh_kwargs = MappingProxyType(d["_sh_kwargs"])
+
     def _get_intensifier_ranking(self, intensifier: AbstractRacer) -> Tuple[int, int]:
         """Given a intensifier, returns how advance it is. This metric will be used to determine
         what priority to assign to the intensifier.
@@ -1278,11 +1384,13 @@ class SuccessiveHalving(ParallelScheduler):
         # We use sh.run_tracker as a cheap way to know how advanced the run is
         # in case of stage ties among successive halvers. sh.run_tracker is
         # also emptied each iteration
-        stage = 0
-        if hasattr(intensifier, "stage"):
-            # Newly created _SuccessiveHalving objects have no stage
-            stage = intensifier.stage
-        return stage, len(intensifier.run_tracker)
+        cache = intensifier._ranking_cache
+        if cache is not None and cache[0] == intensifier._version:
+            return cache[1]
+
+        ranking = (intensifier.stage, len(intensifier.run_tracker))
+        intensifier._ranking_cache = (intensifier._version, ranking)
+        return ranking
 
     def _add_new_instance(self, num_workers: int) -> bool:
         """Decides if it is possible to add a new intensifier instance, and adds it. If a new
@@ -1298,29 +1406,26 @@ class SuccessiveHalving(ParallelScheduler):
         -------
             Whether or not a successive halving instance was added
         """
+        if num_workers == self._saturated_num_workers:
+            return False
+
         if len(self.intensifier_instances) >= num_workers:
+            self._saturated_num_workers = num_workers
             return False
 
-        self.intensifier_instances[len(self.intensifier_instances)] = _SuccessiveHalving(
-            stats=self.stats,
-            traj_logger=self.traj_logger,
-            rng=self.rs,
-            instances=self._instances,
-            instance_specifics=self._instance_specifics,
-            cutoff=self.cutoff,
-            deterministic=self.deterministic,
-            initial_budget=self.initial_budget,
-            max_budget=self.max_budget,
-            eta=self.eta,
-            num_initial_challengers=self.num_initial_challengers,
-            run_obj_time=self.run_obj_time,
-            n_seeds=self.n_seeds,
-            instance_order=self.instance_order,
-            adaptive_capping_slackfactor=self.adaptive_capping_slackfactor,
-            inst_seed_pairs=self.inst_seed_pairs,
-            min_chall=self.min_chall,
-            incumbent_selection=self.incumbent_selection,
-            identifier=len(self.intensifier_instances),
+        sh_kwargs = self._sh_kwargs
+        if self.instance_order == "shuffle":
+            # With instance_order="shuffle", a _SuccessiveHalving reorders its instance-seed pairs
+            # in place after every iteration, so it gets its own copy of the shared list
+            sh_kwargs = dict(sh_kwargs, inst_seed_pairs=list(self.inst_seed_pairs))
+
+        self.intensifier_instances.append(
+            _SuccessiveHalving(
+                **sh_kwargs,
+                identifier=len(self.intensifier_instances),
+            )
         )
+        if len(self.intensifier_instances) >= num_workers:
+            self._saturated_num_workers = num_workers
 
         return True
@@ -101,7 +101,7 @@ class TestHyperband(unittest.TestCase):
         """
         # Mock the_HB instance so we can make sure the correct item is passed
         for i in range(10):
-            self.HB.intensifier_instances[i] = mock.Mock()
+            self.HB.intensifier_instances.append(mock.Mock())
             self.HB.intensifier_instances[i].process_results.return_value = (self.config1, 0.5)
             # make iter false so the mock object is not overwritten
             self.HB.intensifier_instances[i].iteration_done = False
@@ -297,14 +297,19 @@ class TestHyperband(unittest.TestCase):
         self.assertEqual(len(self.HB.intensifier_instances), 0)
         self.assertTrue(self.HB._add_new_instance(num_workers=1))
         self.assertEqual(len(self.HB.intensifier_instances), 1)
+        # With a single worker, no more instances can be added
+        self.assertEqual(self.HB._saturated_num_workers, 1)
         self.assertIsInstance(self.HB.intensifier_instances[0], _Hyperband)
         # A second call should not add a new_HB instance
         self.assertFalse(self.HB._add_new_instance(num_workers=1))
+        self.assertEqual(len(self.HB.intensifier_instances), 1)
 
         # We try with 2_HB instance active
 
         # We effectively return true because we added a new_HB instance
+        # The number of workers grew, so we are no longer saturated
         self.assertTrue(self.HB._add_new_instance(num_workers=2))
+        self.assertEqual(self.HB._saturated_num_workers, 2)
 
         self.assertEqual(len(self.HB.intensifier_instances), 2)
         self.assertIsInstance(self.HB.intensifier_instances[1], _Hyperband)
@@ -473,6 +478,42 @@ class Test_Hyperband(unittest.TestCase):
         self.assertEqual(intensifier.sh_intensifier.initial_budget, 0.125)
         self.assertEqual(intensifier.sh_intensifier.n_configs_in_stage, [8.0, 4.0, 2.0, 1.0])
 
+    def test_update_stage_shuffle(self):
+        """
+        test that instance_order=shuffle reorders the instance-seed pairs between brackets
+        """
+        intensifier = _Hyperband(
+            stats=self.stats,
+            traj_logger=None,
+            rng=np.random.RandomState(12345),
+            deterministic=False,
+            run_obj_time=False,
+            instances=[1, 2, 3, 4, 5],
+            n_seeds=2,
+            initial_budget=2,
+            max_budget=5,
+            eta=2,
+            instance_order="shuffle",
+        )
+        intensifier._update_stage()
+
+        # The bracket works on the pairs of _Hyperband
+        sh = intensifier.sh_intensifier
+        self.assertIs(sh.inst_seed_pairs, intensifier.inst_seed_pairs)
+        pairs_before = list(intensifier.inst_seed_pairs)
+
+        # Finish the iteration of the successive halving bracket
+        sh._update_stage(run_history=self.rh)
+        sh.stage = len(sh.all_budgets) - 1
+        sh._update_stage(run_history=self.rh)
+        self.assertTrue(sh.iteration_done)
+
+        # Next bracket runs on the reordered pairs
+        intensifier._update_stage()
+        self.assertIs(intensifier.sh_intensifier.inst_seed_pairs, intensifier.inst_seed_pairs)
+        self.assertNotEqual(intensifier.inst_seed_pairs, pairs_before)
+        self.assertEqual(sorted(intensifier.inst_seed_pairs), sorted(pairs_before))
+
     def test_eval_challenger(self):
         """
         since hyperband uses eval_challenger and get_next_run of the internal successive halving,
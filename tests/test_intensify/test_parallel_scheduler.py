@@ -39,9 +39,9 @@ class TestParallelScheduler(unittest.TestCase):
             return sh
 
         # Add more SH to make testing interesting
-        instances = {}
-        instances[0] = add_sh_mock(stage=1, config_inst_pairs=6)
-        instances[1] = add_sh_mock(stage=1, config_inst_pairs=2)
+        instances = []
+        instances.append(add_sh_mock(stage=1, config_inst_pairs=6))
+        instances.append(add_sh_mock(stage=1, config_inst_pairs=2))
 
         # We only have two configurations in the same stage.
         # In this case, we want to prioritize the one with more launched runs
@@ -49,11 +49,11 @@ class TestParallelScheduler(unittest.TestCase):
         self.assertEqual(list(scheduler._sort_instances_by_stage(instances)), [0, 1])
 
         # One more instance comparison to be supper safe
-        instances[2] = add_sh_mock(stage=1, config_inst_pairs=7)
+        instances.append(add_sh_mock(stage=1, config_inst_pairs=7))
         self.assertEqual(list(scheduler._sort_instances_by_stage(instances)), [2, 0, 1])
 
         # Not let us add a more advanced stage run
-        instances[3] = add_sh_mock(stage=2, config_inst_pairs=1)
+        instances.append(add_sh_mock(stage=2, config_inst_pairs=1))
         self.assertEqual(list(scheduler._sort_instances_by_stage(instances)), [3, 2, 0, 1])
 
         # Make 1 the oldest stage
@@ -61,7 +61,7 @@ class TestParallelScheduler(unittest.TestCase):
         self.assertEqual(list(scheduler._sort_instances_by_stage(instances)), [1, 3, 2, 0])
 
         # Add a new run that's empty
-        instances[4] = add_sh_mock(stage=0, config_inst_pairs=0)
+        instances.append(add_sh_mock(stage=0, config_inst_pairs=0))
         self.assertEqual(list(scheduler._sort_instances_by_stage(instances)), [1, 3, 2, 0, 4])
 
         # Make 4 stage 4 but with not as many instances as 1
@@ -83,11 +83,11 @@ class TestParallelScheduler(unittest.TestCase):
             deterministic=True,
         )
 
-        scheduler.intensifier_instances = {
-            0: mock.Mock(),
-            1: mock.Mock(),
-            2: mock.Mock(),
-        }
+        scheduler.intensifier_instances = [
+            mock.Mock(),
+            mock.Mock(),
+            mock.Mock(),
+        ]
 
         run_info = RunInfo(
             config=None,
@@ -119,7 +119,7 @@ class TestParallelScheduler(unittest.TestCase):
             deterministic=True,
         )
         scheduler._get_intensifier_ranking = mock_ranker
-        scheduler.intensifier_instances = {0: mock.Mock()}
+        scheduler.intensifier_instances = [mock.Mock()]
         scheduler.intensifier_instances[0].get_next_run.return_value = (RunInfoIntent.WAIT, None)
         scheduler.intensifier_instances[0].stage = 0
         scheduler.intensifier_instances[0].run_tracker = ()
@@ -155,7 +155,7 @@ class TestParallelScheduler(unittest.TestCase):
 
             def instance_added(args):
                 source_id = len(scheduler.intensifier_instances)
-                scheduler.intensifier_instances[source_id] = mock.Mock()
+                scheduler.intensifier_instances.append(mock.Mock())
                 scheduler.intensifier_instances[source_id].get_next_run.return_value = (
                     RunInfoIntent.RUN,
                     None,
@@ -164,7 +164,7 @@ class TestParallelScheduler(unittest.TestCase):
 
             add_new_instance.side_effect = instance_added
             scheduler._get_intensifier_ranking = mock_ranker
-            scheduler.intensifier_instances = {0: mock.Mock()}
+            scheduler.intensifier_instances = [mock.Mock()]
             scheduler.intensifier_instances[0].get_next_run.return_value = (
                 RunInfoIntent.WAIT,
                 None,
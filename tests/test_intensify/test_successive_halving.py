@@ -1,4 +1,6 @@
+import copy
 import logging
+import pickle
 import time
 import unittest
 from unittest import mock
@@ -93,15 +95,37 @@ class TestSuccessiveHalving(unittest.TestCase):
 
         # Parameters properly passed to _SH
         self.assertEqual(len(self.SH.intensifier_instances[0].inst_seed_pairs), 10)
+        self.assertIs(self.SH.intensifier_instances[0].inst_seed_pairs, self.SH.inst_seed_pairs)
         self.assertEqual(self.SH.intensifier_instances[0].initial_budget, 2)
         self.assertEqual(self.SH.intensifier_instances[0].max_budget, 5)
 
+    def test_sh_kwargs_read_only(self):
+        """Makes sure the arguments shared by all _SH cannot be modified"""
+        with self.assertRaises(TypeError):
+            self.SH._sh_kwargs["eta"] = 3
+
+    def test_pickle(self):
+        """Makes sure SH can be pickled and copied"""
+        self.assertTrue(self.SH._add_new_instance(num_workers=1))
+
+        for SH in (pickle.loads(pickle.dumps(self.SH)), copy.deepcopy(self.SH)):
+            self.assertEqual(dict(SH._sh_kwargs).keys(), dict(self.SH._sh_kwargs).keys())
+            self.assertEqual(SH._sh_kwargs["eta"], 2)
+            self.assertEqual(SH.inst_seed_pairs, self.SH.inst_seed_pairs)
+            self.assertEqual(len(SH.intensifier_instances), 1)
+
+            # The shared arguments are still read-only and can create new _SH
+            with self.assertRaises(TypeError):
+                SH._sh_kwargs["eta"] = 3
+            self.assertTrue(SH._add_new_instance(num_workers=2))
+            self.assertIsInstance(SH.intensifier_instances[1], _SuccessiveHalving)
+
     def test_process_results_via_sourceid(self):
         """Makes sure source id is honored when deciding
         which _SH will consume the result/run_info"""
         # Mock the _SH so we can make sure the correct item is passed
         for i in range(10):
-            self.SH.intensifier_instances[i] = mock.Mock()
+            self.SH.intensifier_instances.append(mock.Mock())
 
         # randomly create run_infos and push into SH. Then we will make
         # sure they got properly allocated
@@ -256,14 +280,19 @@ class TestSuccessiveHalving(unittest.TestCase):
         self.assertEqual(len(self.SH.intensifier_instances), 0)
         self.assertTrue(self.SH._add_new_instance(num_workers=1))
         self.assertEqual(len(self.SH.intensifier_instances), 1)
+        # With a single worker, no more instances can be added
+        self.assertEqual(self.SH._saturated_num_workers, 1)
         self.assertIsInstance(self.SH.intensifier_instances[0], _SuccessiveHalving)
         # A second call should not add a new _SH
         self.assertFalse(self.SH._add_new_instance(num_workers=1))
+        self.assertEqual(len(self.SH.intensifier_instances), 1)
 
         # We try with 2 _SH active
 
         # We effectively return true because we added a new _SH
+        # The number of workers grew, so we are no longer saturated
         self.assertTrue(self.SH._add_new_instance(num_workers=2))
+        self.assertEqual(self.SH._saturated_num_workers, 2)
 
         self.assertEqual(len(self.SH.intensifier_instances), 2)
         self.assertIsInstance(self.SH.intensifier_instances[1], _SuccessiveHalving)
@@ -272,6 +301,90 @@ class TestSuccessiveHalving(unittest.TestCase):
         self.assertFalse(self.SH._add_new_instance(num_workers=2))
         self.assertEqual(len(self.SH.intensifier_instances), 2)
 
+    def test_shared_inst_seed_pairs(self):
+        """Makes sure all _SH evaluate the same seeds in the same order"""
+        self.assertTrue(self.SH._add_new_instance(num_workers=2))
+        self.assertTrue(self.SH._add_new_instance(num_workers=2))
+
+        pairs_0 = self.SH.intensifier_instances[0].inst_seed_pairs
+        pairs_1 = self.SH.intensifier_instances[1].inst_seed_pairs
+        self.assertEqual(pairs_0, pairs_1)
+        self.assertEqual(len({s for _, s in pairs_0}), 2)
+
+        # The pairs are the ones a single _SH draws from the same random state
+        _SH = _SuccessiveHalving(
+            stats=self.stats,
+            traj_logger=TrajLogger(output_dir=None, stats=self.stats),
+            rng=np.random.RandomState(12345),
+            deterministic=False,
+            run_obj_time=False,
+            instances=[1, 2, 3, 4, 5],
+            n_seeds=2,
+            initial_budget=2,
+            max_budget=5,
+            eta=2,
+        )
+        self.assertEqual(pairs_0, _SH.inst_seed_pairs)
+
+    def test_get_intensifier_ranking_cache(self):
+        """Makes sure the ranking is cached and invalidated when the _SH changes"""
+        self.assertTrue(self.SH._add_new_instance(num_workers=1))
+        sh = self.SH.intensifier_instances[0]
+
+        # A newly created _SH has the default stage 0 and an empty run tracker
+        self.assertEqual(self.SH._get_intensifier_ranking(sh), (0, 0))
+        self.assertEqual(sh._ranking_cache, (sh._version, (0, 0)))
+
+        # Launching a run changes the tie breaker
+        intent, run_info = sh.get_next_run(
+            challengers=[self.config1],
+            incumbent=None,
+            chooser=None,
+            run_history=self.rh,
+        )
+        self.assertEqual(intent, RunInfoIntent.RUN)
+        self.assertEqual(self.SH._get_intensifier_ranking(sh), (0, 1))
+        self.assertEqual(sh._ranking_cache, (sh._version, (0, 1)))
+
+        # Without a version bump, the cached ranking is returned without looking at the _SH
+        sh.stage = 3
+        self.assertEqual(self.SH._get_intensifier_ranking(sh), (0, 1))
+
+        # A version bump invalidates the cache
+        sh._version += 1
+        self.assertEqual(self.SH._get_intensifier_ranking(sh), (3, 1))
+        self.assertEqual(sh._ranking_cache, (sh._version, (3, 1)))
+
+    def test_shuffle_does_not_modify_shared_pairs(self):
+        """Makes sure instance_order=shuffle reorders a copy of the shared instance-seed pairs"""
+        SH = SuccessiveHalving(
+            stats=self.stats,
+            traj_logger=TrajLogger(output_dir=None, stats=self.stats),
+            rng=np.random.RandomState(12345),
+            deterministic=False,
+            run_obj_time=False,
+            instances=[1, 2, 3, 4, 5],
+            n_seeds=2,
+            initial_budget=2,
+            max_budget=5,
+            eta=2,
+            instance_order="shuffle",
+        )
+        shared_pairs = list(SH.inst_seed_pairs)
+        self.assertTrue(SH._add_new_instance(num_workers=1))
+        sh = SH.intensifier_instances[0]
+
+        # Finish the iteration of the _SH so that it moves to a new one
+        sh._update_stage(run_history=self.rh)
+        sh.stage = len(sh.all_budgets) - 1
+        sh._update_stage(run_history=self.rh)
+        self.assertEqual(sh.sh_iters, 1)
+
+        # The _SH got a new order, but the pairs of the scheduler are untouched
+        self.assertIsNot(sh.inst_seed_pairs, SH.inst_seed_pairs)
+        self.assertEqual(sorted(sh.inst_seed_pairs), sorted(shared_pairs))
+        self.assertEqual(SH.inst_seed_pairs, shared_pairs)
+
     def _exhaust_run_and_get_incumbent(self, sh, rh, num_workers=2):
         """
         Runs all provided configs on all intensifier_instances and return the incumbent